@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+"""
+Benchmarks for the table decode, encode and formatting hot paths of ytable.
+
+Synthetic reports are generated in the shape a Yenot server sends them (a
+column list with type meta-data and rows of JSON-native values) for narrow
+and wide schemas covering every type handled by BasicTypePlugin.  Results are
+written as JSON; pass --compare with a previously stored result file to flag
+regressions.
+
+    python benchmarks/bench_ytable.py --output baseline.json
+    python benchmarks/bench_ytable.py --compare baseline.json
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import datetime
+import platform
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import ytable  # noqa: E402
+from ytable import reportcore, serialization  # noqa: E402
+
+ytable.add_type_definition_plugin(ytable.BasicTypePlugin())
+
+# One entry per type handled in BasicTypePlugin.polish plus the types with a
+# dedicated converter in as_python.  Each entry is (type, widget_kwargs,
+# value generator).
+EPOCH = datetime.datetime(2020, 1, 1)
+
+
+def _date(rand):
+    return (EPOCH + datetime.timedelta(days=rand.randint(0, 2000))).date().isoformat()
+
+
+def _datetime(rand):
+    return (EPOCH + datetime.timedelta(seconds=rand.randint(0, 10**8))).isoformat()
+
+
+TYPE_SAMPLES = [
+    (None, None, lambda rand: f"text {rand.randint(0, 10**6)}"),
+    ("boolean", None, lambda rand: rand.choice([True, False, None])),
+    ("dictionary", None, lambda rand: {"k": rand.randint(0, 99)}),
+    ("stringlist", None, lambda rand: ["a", None, str(rand.randint(0, 99))]),
+    ("integer", None, lambda rand: rand.randint(-(10**6), 10**6)),
+    ("numeric", {"decimals": 3}, lambda rand: rand.uniform(-1000, 1000)),
+    ("percent", None, lambda rand: rand.random()),
+    ("filesize", None, lambda rand: rand.randint(0, 10**9)),
+    ("html", None, lambda rand: "<b>bold</b>"),
+    ("multiline", None, lambda rand: "line 1\nline 2"),
+    ("date", None, _date),
+    ("datetime", None, _datetime),
+    ("datetimeflex", None, _date),
+    ("currency_usd", None, lambda rand: round(rand.uniform(-(10**5), 10**5), 2)),
+    ("currency_usd", {"blankzero": True}, lambda rand: rand.choice([0.0, 12.5])),
+    ("binary", None, lambda rand: "aGVsbG8gd29ybGQ="),
+    ("matrix", None, lambda rand: [rand.randint(0, 50) for _ in range(3)]),
+]
+
+SCHEMAS = {"narrow": 1, "wide": 4}
+
+
+def synthetic_report(width, rows, seed=0):
+    """
+    Return (columns, rows) with the primary key column followed by `width`
+    copies of every sample type.
+    """
+    rand = random.Random(seed)
+    columns = [("id", {"type": "integer", "primary_key": True})]
+    generators = [("id", None)]
+    for index in range(width):
+        for type_, widget_kwargs, gen in TYPE_SAMPLES:
+            attr = f"{type_ or 'text'}_{index}_{len(columns)}"
+            meta = {"type": type_} if type_ != None else None
+            if widget_kwargs != None:
+                meta["widget_kwargs"] = dict(widget_kwargs)
+            columns.append((attr, meta))
+            generators.append((attr, gen))
+
+    data = []
+    for i in range(rows):
+        row = {attr: gen(rand) if gen != None else i for attr, gen in generators}
+        data.append(row)
+    return columns, data
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {"min": min(samples), "median": statistics.median(samples)}
+
+
+def bench_case(schema, nrows, repeat):
+    columns, raw = synthetic_report(SCHEMAS[schema], nrows)
+    table = ytable.ClientTable(columns, raw)
+    native = [r._as_dict() for r in table.rows]
+    # DateTimeEncoder has no representation for bytes
+    binary = [c.attr for c in table.columns_full if c.type_ == "binary"]
+    writable = table.as_writable(exclusions=binary)
+    # as_python leaves datetimeflex as sent; the formatter expects date objects
+    format_inputs = []
+    for c in table.columns:
+        values = [getattr(r, c.attr) for r in table.rows]
+        if c.type_ == "datetimeflex":
+            values = [reportcore.parse_date(v) for v in values]
+        format_inputs.append((c.formatter, values))
+
+    def construct():
+        ytable.ClientTable(columns, raw)
+
+    # a grid typically shows a fraction of a wide report
+    projection = {x[0] for x in columns[: len(TYPE_SAMPLES)]}
+
+    def construct_projected():
+        ytable.ClientTable(columns, raw, projection=projection)
+
+    def as_python():
+        f = reportcore.as_python(columns)
+        for r in raw:
+            f(r)
+
+    def as_client():
+        f = reportcore.as_client(columns)
+        for r in native:
+            f(r)
+
+    def parse_columns():
+        reportcore.parse_columns(columns)
+        reportcore.parse_columns_full(columns)
+
+    def formatters():
+        for fmt, values in format_inputs:
+            for v in values:
+                fmt(v)
+
+    def matrix_link():
+        for r in table.rows:
+            for c in table.columns_full:
+                if c.type_ != "matrix":
+                    continue
+                link = getattr(r, c.attr)
+                link.toggle(7, True)
+                link.toggle(7, False)
+                7 in link
+                link.serialized()
+
+    cases = {
+        "ClientTable": construct,
+        "ClientTable_projected": construct_projected,
+        "as_python": as_python,
+        "as_client": as_client,
+        "parse_columns": parse_columns,
+        "as_writable": table.as_writable,
+        "serialize": lambda: serialization.serialize(writable),
+        "formatters": formatters,
+        "MatrixLink": matrix_link,
+    }
+
+    results = {}
+    for name, func in cases.items():
+        key = f"{name}/{schema}/{nrows}"
+        results[key] = timed(func, repeat)
+        results[key].update({"rows": nrows, "columns": len(columns)})
+        print(f"{key:40} {results[key]['min']:10.4f}s", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, threshold, min_delta):
+    """
+    Return a list of (key, baseline, current) for benchmarks whose best time
+    exceeds the baseline by more than `threshold` (a fraction) and by more
+    than `min_delta` seconds, so that timer noise on very short cases is not
+    reported.
+    """
+    regressions = []
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]["min"]
+        slowdown = current["min"] - before
+        if slowdown > before * threshold and slowdown > min_delta:
+            regressions.append((key, before, current["min"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="row counts to benchmark (use 1000000 for the full run)",
+    )
+    parser.add_argument(
+        "--schema", choices=list(SCHEMAS), nargs="+", default=list(SCHEMAS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="fractional slowdown allowed before flagging a regression",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.005,
+        help="absolute slowdown in seconds below which nothing is flagged",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for schema in args.schema:
+        for nrows in args.rows:
+            results.update(bench_case(schema, nrows, args.repeat))
+
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": datetime.datetime.now().isoformat(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=4)
+    else:
+        print(json.dumps(document, indent=4))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for key, before, after in regressions:
+            print(
+                f"REGRESSION {key}:  {before:.4f}s -> {after:.4f}s ({after / before - 1.0:+.1%})",
+                file=sys.stderr,
+            )
+        if len(regressions) > 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,3 +11,5 @@ from .reportcore import *  # noqa: F401
 from .client import *  # noqa: F401
 from .serialization import *  # noqa: F401
 from .basic_types import *  # noqa: F401
+from . import instrument  # noqa: F401
+from . import models  # noqa: F401
@@ -1,5 +1,12 @@
+import copy
+import time
+import weakref
+import itertools
+import threading
 import contextlib
+import collections.abc
 from . import reportcore
+from . import instrument
 from . import serialization
 
 
@@ -9,16 +16,122 @@ def simple_table(columns, column_map=None):
     return ClientTable([(c, column_map.get(c, None)) for c in columns], [])
 
 
+class RowSnapshot(collections.abc.Sequence):
+    """
+    Read-only view of the first `length` rows of a list as of one version of
+    a ClientTable.  The table only ever appends to a list once a snapshot
+    refers to it, so the view is stable while writers publish newer versions.
+    """
+
+    def __init__(self, rows, version, length=None):
+        self._rows = rows
+        self.version = version
+        self._length = len(rows) if length == None else length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._rows[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return self._rows[index]
+
+    def __iter__(self):
+        return itertools.islice(self._rows, self._length)
+
+    def __repr__(self):
+        return f"RowSnapshot(version={self.version}, rows={self._length})"
+
+
+class UnprojectedColumns:
+    """
+    Columns left out of a projected ClientTable.  Each row keeps the raw row
+    it was decoded from in its `_raw_` slot and values are converted from it
+    one column at a time when requested.
+    """
+
+    def __init__(self, columns, converter):
+        self.columns = {x[0]: x for x in columns}
+        self.converter = converter
+        self._converters = {}
+
+    def value(self, row, attr):
+        if attr not in self.columns:
+            raise KeyError(f"{attr} is not an unprojected column")
+        raw = getattr(row, "_raw_", None)
+        if raw == None:
+            raise KeyError(f"row {row} was not loaded from the raw payload")
+        to_python = self._converters.get(attr, None)
+        if to_python == None:
+            to_python = self.converter([self.columns[attr]])
+            self._converters[attr] = to_python
+        return to_python(raw)[0]
+
+
 class ClientTable:
     """
     Tabular API from a Yenot serialized table structure with rich type
     information.
     """
 
-    def __init__(self, columns, rows, mixin=None, to_localtime=True):
+    def __init__(
+        self,
+        columns,
+        rows,
+        mixin=None,
+        to_localtime=True,
+        projection=None,
+        retain_raw=False,
+    ):
+        """
+        Pass a set of attrs as `projection` to convert and store only those
+        columns (primary key columns are always kept).  With `retain_raw` the
+        raw rows are kept so the other columns can be converted on demand with
+        `unprojected_value`; it requires a `projection`.
+        """
+        if retain_raw and projection == None:
+            raise ValueError("retain_raw requires a projection")
         self.to_localtime = to_localtime
-        f = self.row_factory(columns, mixin=mixin)
-        self.rows = [f(x) for x in rows]
+        self._init_versioning()
+        if instrument.COLLECTOR.enabled:
+            with instrument.loading(self.__class__.__name__) as stats:
+                self.load_stats = stats
+                self._load(columns, rows, mixin, projection, retain_raw)
+        else:
+            self.load_stats = None
+            self._load(columns, rows, mixin, projection, retain_raw)
+
+    def _load(self, columns, rows, mixin, projection=None, retain_raw=False):
+        self.unprojected = None
+        if projection != None:
+            keys = {
+                col[0]
+                for col in columns
+                if col[1] != None and col[1].get("primary_key", False)
+            }
+            projected = reportcore.project_columns(columns, keys.union(projection))
+            if retain_raw:
+                self.unprojected = UnprojectedColumns(
+                    [x for x in columns if x not in projected], self.converter
+                )
+            columns = projected
+
+        stats = self.load_stats
+        with instrument.stage("row_factory"):
+            f = self.row_factory(
+                columns,
+                mixin=mixin,
+                stats=stats,
+                retain_raw=self.unprojected != None,
+            )
+        self._rows = [f(x) for x in rows]
+        if stats != None:
+            stats.count("rows", len(self._rows))
+            stats.count("cells", len(self._rows) * len(columns))
 
         # initialize pkey for deletion
         pkey = [
@@ -34,11 +147,147 @@ class ClientTable:
 
         self.deleted_rows = []
 
+    def unprojected_value(self, row, attr):
+        """
+        Convert and return the value of a column left out by the projection
+        for a row loaded from the retained raw payload.
+        """
+        if self.unprojected == None:
+            raise KeyError(f"{attr} is not available; raw rows were not retained")
+        return self.unprojected.value(row, attr)
+
+    def _init_versioning(self):
+        self.version = 0
+        # _rows_lock guards swapping self._rows and taking snapshots;
+        # _write_lock serializes writers for the whole of their update
+        self._rows_lock = threading.RLock()
+        self._write_lock = threading.RLock()
+        # the snapshot of the current version, if any reader has taken one
+        self._snapshot = None
+        # True when a snapshot of this or an earlier version refers to
+        # self._rows; it may then only be appended to without a copy
+        self._rows_shared = False
+        # rows added on the client which the server does not have yet
+        self._added_rows = weakref.WeakSet()
+
+    @property
+    def rows(self):
+        """
+        The writable list of rows.  If a snapshot of the current version has
+        been taken the list is copied first (once per version) so that the
+        snapshot is unaffected by changes made through it.  Do not keep the
+        list across a call to `snapshot`; readers wanting a stable view should
+        use `snapshot` rather than this list.
+        """
+        if self._rows_shared:
+            with self._rows_lock:
+                if self._rows_shared:
+                    self._detach_rows()
+                    # the caller may change the list in place
+                    self.version += 1
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows):
+        self.publish(rows)
+
+    def _detach_rows(self):
+        # caller holds self._rows_lock and starts a new version; copy the list
+        # away from the snapshots referring to it, if any
+        if self._rows_shared:
+            self._rows = list(self._rows)
+            self._rows_shared = False
+            self._snapshot = None
+
+    def _append_rows(self, rows):
+        # caller holds self._rows_lock; snapshots only see their own length
+        # of the list so appending needs no copy
+        self._rows.extend(rows)
+        self._snapshot = None
+        self.version += 1
+
+    def snapshot(self):
+        """
+        Return an immutable RowSnapshot of the current rows in O(1).  Safe to
+        call from any thread.
+
+        >>> t = simple_table(["a"])
+        >>> with t.adding_row() as row:
+        ...     row.a = 1
+        >>> snap = t.snapshot()
+        >>> t.rows.append(t.candidate_row())
+        >>> t.set_value(0, "a", 2)
+        >>> len(snap), snap[0].a, len(t.rows), t.rows[0].a
+        (1, 1, 2, 2)
+        >>> snap.version < t.snapshot().version
+        True
+        """
+        snap = self._snapshot
+        if snap == None:
+            with self._rows_lock:
+                if self._snapshot == None:
+                    self._snapshot = RowSnapshot(self._rows, self.version)
+                    self._rows_shared = True
+                snap = self._snapshot
+        return snap
+
+    def _swap_rows(self, rows):
+        # caller holds self._write_lock
+        with self._rows_lock:
+            self._rows = rows
+            self._snapshot = None
+            self._rows_shared = False
+            self.version += 1
+            return self.version
+
+    def publish(self, rows, reload=False):
+        """
+        Atomically replace the rows with `rows` (for instance a refreshed set
+        built on a worker thread) as a new version.  The table takes ownership
+        of the list.  Pass `reload` when `rows` is a fresh load from the
+        server to also forget the rows deleted and added since the last one.
+        """
+        with self._write_lock:
+            if reload:
+                self.deleted_rows = []
+                self._added_rows = weakref.WeakSet()
+            return self._swap_rows(rows)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Yield a private copy of the row list to be edited and publish it as a
+        new version on exit.  Nothing is published if the block raises.
+        Readers are not blocked while the block runs but other writers wait.
+        This costs one copy of the list, so it suits long updates such as a
+        worker thread refresh; single edits are cheaper with `set_values` and
+        the other writing methods.
+
+        Row objects are shared between versions; replace rather than mutate
+        rows which readers may hold.  Rows appended here are treated as loaded
+        from the server; add new rows with `insert_rows` or `adding_row` so
+        that removing them does not record a deletion.
+        """
+        with self._write_lock:
+            with self._rows_lock:
+                rows = list(self._rows)
+            yield rows
+            self._swap_rows(rows)
+
     def duplicate(self, rows, deleted="duplicate"):
         # TODO:  make sure that deleted rows don't show up here as rows to save
         x = self.__class__.__new__(self.__class__)
         x.DataRow = self.DataRow
-        x.rows = rows[:]
+        x.load_stats = None
+        x.unprojected = self.unprojected
+        x._init_versioning()
+        x._added_rows.update(self._added_rows)
+        if isinstance(rows, RowSnapshot):
+            # share the snapshot list; copied on first write
+            x._rows = rows[:] if len(rows) != len(rows._rows) else rows._rows
+            x._rows_shared = x._rows is rows._rows
+        else:
+            x._rows = list(rows)
         x.columns = self.columns
         x.columns_full = self.columns_full
         x.pkey = self.pkey
@@ -51,9 +300,19 @@ class ClientTable:
     def converter(self, row_field_list):
         return reportcore.as_python(row_field_list, to_localtime=self.to_localtime)
 
-    def row_factory(self, row_field_list, mixin):
+    def row_factory(self, row_field_list, mixin, stats=None, retain_raw=False):
+        """
+        Create self.DataRow and return a function constructing a DataRow from
+        a raw row.  With `stats` the returned function also accumulates the
+        "convert" and "construct" stage timings.  With `retain_raw` each row
+        keeps its raw row in the `_raw_` slot.  The untimed function is kept
+        as self._init_row.
+        """
         self.DataRow = reportcore.fixedrecord(
-            "DataRow", [r[0] for r in row_field_list], mixin=mixin
+            "DataRow",
+            [r[0] for r in row_field_list],
+            mixin=mixin,
+            base=reportcore.RawSlottedRow if retain_raw else reportcore.SlottedRow,
         )
         to_python = self.converter(row_field_list)
 
@@ -67,16 +326,209 @@ class ClientTable:
             x._rtlib_init_()
             return x
 
-        return init_custom if hasattr(self.DataRow, "_rtlib_init_") else init_bare
+        def init_raw(r):
+            nonlocal to_python, self
+            x = self.DataRow(*to_python(r))
+            x._raw_ = r
+            if custom:
+                x._rtlib_init_()
+            return x
+
+        custom = hasattr(self.DataRow, "_rtlib_init_")
+        if retain_raw:
+            self._init_row = init_raw
+        else:
+            self._init_row = init_custom if custom else init_bare
+        if stats == None:
+            return self._init_row
+
+        timings = stats.timings
+        timings.setdefault("convert", 0.0)
+        timings.setdefault("construct", 0.0)
+        clock = time.perf_counter
+
+        def init_timed(r):
+            nonlocal to_python, self
+            start = clock()
+            values = to_python(r)
+            converted = clock()
+            x = self.DataRow(*values)
+            if retain_raw:
+                x._raw_ = r
+            if custom:
+                x._rtlib_init_()
+            timings["convert"] += converted - start
+            timings["construct"] += clock() - converted
+            return x
+
+        return init_timed
 
     @contextlib.contextmanager
     def adding_row(self):
         row = self.candidate_row()
         yield row
-        self.rows.append(row)
+        with self._write_lock, self._rows_lock:
+            self._append_rows([row])
+            self._added_rows.add(row)
         if hasattr(row, "_row_added_"):
             row._row_added_()
 
+    def paste_block(self, block, top, left):
+        """
+        Coerce a 2D block of strings (a list of lines, each a list of cell
+        strings) with the coerce_edit of each column and assign the values to
+        the rectangle of rows and self.columns with upper left corner (top,
+        left).  Each distinct string is coerced once per column.  Cells which
+        fail to coerce or fall in a non-editable column are left untouched and
+        returned as a list of (row index, attr, text, exception); all other
+        values are assigned to copies of the affected rows published together
+        as one new version.
+
+        >>> t = simple_table(["a", "b"], {"a": {"editable": True}})
+        >>> for i in range(3):
+        ...     with t.adding_row() as row:
+        ...         row.a = 0
+        >>> calls = []
+        >>> t.columns[0].coerce_edit = lambda text: calls.append(text) or int(text)
+        >>> errors = t.paste_block([["1", "x"], ["1", "y"], ["q", "z"]], 0, 0)
+        >>> [row.a for row in t.rows], calls
+        ([1, 1, 0], ['1', 'q'])
+        >>> [(index, attr, text) for index, attr, text, e in errors]
+        [(2, 'a', 'q'), (0, 'b', 'x'), (1, 'b', 'y'), (2, 'b', 'z')]
+        >>> t.paste_block([["1"]] * 4, 0, 0)
+        Traceback (most recent call last):
+        ...
+        IndexError: paste block of 4x1 at (0, 0) does not fit in the table
+        """
+        width = max((len(line) for line in block), default=0)
+        message = f"paste block of {len(block)}x{width} at ({top}, {left}) does not fit in the table"
+        if top < 0 or left < 0 or left + width > len(self.columns):
+            raise IndexError(message)
+
+        with instrument.loading("paste_block") as stats:
+            with stats.stage("coerce"):
+                errors, updates, hits = self._coerce_block(block, top, left, width)
+            stats.count("cells", sum(len(line) for line in block))
+            stats.count("cache_hits", hits)
+
+        with self._write_lock:
+            # checked under the lock so that no other writer shrinks the rows
+            # before the values are applied
+            if top + len(block) > len(self._rows):
+                raise IndexError(message)
+            self.set_values(
+                (index, attr, value)
+                for attr, values in updates
+                for index, value in values
+            )
+        return errors
+
+    def _copy_row(self, row):
+        x = copy.copy(row)
+        if row in self._added_rows:
+            self._added_rows.add(x)
+        return x
+
+    def set_value(self, index, attr, value):
+        """
+        Assign `value` to `attr` of the row at `index`; see `set_values`.
+        """
+        self.set_values([(index, attr, value)])
+
+    def set_values(self, edits):
+        """
+        Apply an iterable of (row index, attr, value) as one new version.  Each
+        edited row is replaced by a copy since snapshots may hold the original
+        and the row list itself is copied at most once, and only if a snapshot
+        refers to it.  Group edits here rather than calling `set_value` with
+        snapshots taken in between.
+        """
+        with self._write_lock, self._rows_lock:
+            self._detach_rows()
+            rows = self._rows
+            copies = {}
+            for index, attr, value in edits:
+                row = copies.get(index, None)
+                if row == None:
+                    row = copies[index] = self._copy_row(rows[index])
+                    rows[index] = row
+                setattr(row, attr, value)
+            self.version += 1
+
+    def insert_rows(self, rows, position=None):
+        """
+        Insert new rows (not yet on the server) at `position`, default at the
+        end, as a new version.  Returns the position.
+        """
+        rows = list(rows)
+        with self._write_lock, self._rows_lock:
+            if position == None or position == len(self._rows):
+                position = len(self._rows)
+                self._append_rows(rows)
+            else:
+                self._detach_rows()
+                self._rows[position:position] = rows
+                self.version += 1
+            self._added_rows.update(rows)
+        return position
+
+    def remove_rows(self, first, count):
+        """
+        Remove `count` rows starting at `first` as a new version and return
+        them.  Removed rows which were loaded from the server (and so have a
+        primary key) are recorded in deleted_rows for saving.
+        """
+        with self._write_lock, self._rows_lock:
+            self._detach_rows()
+            removed = self._rows[first : first + count]
+            del self._rows[first : first + count]
+            self.version += 1
+            self.deleted_rows += [r for r in removed if self._persisted(r)]
+        return removed
+
+    def _persisted(self, row):
+        if row in self._added_rows:
+            return False
+        # a row without any key value cannot be deleted on the server
+        keys = [getattr(row, p, None) for p in self.pkey]
+        return len(keys) == 0 or any(k != None for k in keys)
+
+    def _coerce_block(self, block, top, left, width):
+        errors = []
+        updates = []
+        hits = 0
+        for j in range(width):
+            column = self.columns[left + j]
+            cells = [
+                (top + i, line[j]) for i, line in enumerate(block) if j < len(line)
+            ]
+            if not column.editable:
+                e = ValueError(f"column {column.attr} is not editable")
+                errors += [(index, column.attr, text, e) for index, text in cells]
+                continue
+
+            coerce = column.coerce_edit
+            memo = {}
+            failed = {}
+            values = []
+            for index, text in cells:
+                if text in memo:
+                    hits += 1
+                    values.append((index, memo[text]))
+                elif text in failed:
+                    hits += 1
+                    errors.append((index, column.attr, text, failed[text]))
+                else:
+                    try:
+                        memo[text] = coerce(text)
+                    except Exception as e:
+                        failed[text] = e
+                        errors.append((index, column.attr, text, e))
+                    else:
+                        values.append((index, memo[text]))
+            updates.append((column.attr, values))
+        return errors, updates, hits
+
     def candidate_row(self):
         newself = self.DataRow.__new__(self.DataRow)
         try:
@@ -107,7 +559,7 @@ class ClientTable:
             and getter == None
         ):
             attrs = self.DataRow.__slots__
-            slimrows = [r._as_dict() for r in self.rows]
+            slimrows = [r._as_dict() for r in self.snapshot()]
         else:
             if inclusions != None:
                 attrs = list(inclusions)
@@ -120,7 +572,7 @@ class ClientTable:
 
             getter = getter if getter != None else getattr
             slimrows = []
-            for r in self.rows:
+            for r in self.snapshot():
                 slim = {a: getter(r, a) for a in attrs}
                 slimrows.append(slim)
 
@@ -147,7 +599,7 @@ class ClientTable:
         if column_map == None:
             column_map = {}
         columns = [(c, column_map.get(c, None)) for c in self.DataRow.__slots__]
-        rows = [r._as_tuple() for r in self.rows]
+        rows = [r._as_tuple() for r in self.snapshot()]
         return columns, rows
 
 
@@ -162,3 +614,216 @@ class UnparsingClientTable(ClientTable):
 
     def converter(self, row_field_list):
         return reportcore.as_client(row_field_list, to_localtime=self.to_localtime)
+
+
+class PagedRows(collections.abc.Sequence):
+    """
+    Sequence of `row_count` rows fetched and decoded a page at a time.  At
+    most `max_pages` decoded pages are kept (least recently used are dropped)
+    and, when an `executor` (e.g. a concurrent.futures.ThreadPoolExecutor) is
+    given, the next `prefetch` pages in the direction of travel are loaded in
+    the background on moving to a new page.  Without an executor pages are
+    only fetched on demand.  Pages fetched before a call to `clear` are
+    discarded when they arrive.
+    """
+
+    def __init__(
+        self,
+        row_count,
+        fetch,
+        init_row,
+        page_size=1000,
+        max_pages=16,
+        prefetch=1,
+        executor=None,
+    ):
+        if executor != None and max_pages <= prefetch:
+            raise ValueError("max_pages must exceed prefetch")
+        self.row_count = row_count
+        self.fetch = fetch
+        self.init_row = init_row
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.prefetch = prefetch
+        self.executor = executor
+
+        self.hits = 0
+        self.misses = 0
+        # hits since the last page fetch, reported with the next fetch
+        self._unreported_hits = 0
+        self._pages = collections.OrderedDict()
+        self._pending = {}
+        self._last_page = None
+        # bumped by clear so that fetches started before it are not cached
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.row_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.row_count))]
+        if index < 0:
+            index += self.row_count
+        if not 0 <= index < self.row_count:
+            raise IndexError("row index out of range")
+        number, offset = divmod(index, self.page_size)
+        return self.page(number)[offset]
+
+    def page(self, number):
+        with self._lock:
+            page = self._pages.get(number, None)
+            if page != None:
+                self._pages.move_to_end(number)
+                self.hits += 1
+                self._unreported_hits += 1
+            else:
+                self.misses += 1
+            previous, self._last_page = self._last_page, number
+
+        if page == None:
+            page = self._load_page(number)
+        if previous != number and self.executor != None:
+            direction = -1 if previous != None and number < previous else 1
+            self._prefetch(number, direction)
+        return page
+
+    def _load_page(self, number):
+        with self._lock:
+            future = self._pending.pop(number, None)
+        if future != None:
+            return future.result()
+        return self._fetch_page(number, prefetched=False)
+
+    def _fetch_page(self, number, prefetched=True):
+        offset = number * self.page_size
+        limit = min(self.page_size, self.row_count - offset)
+        with self._lock:
+            generation = self._generation
+        with instrument.loading(self.__class__.__name__) as stats:
+            with stats.stage("fetch"):
+                raw = self.fetch(offset, limit)
+            if len(raw) != limit:
+                raise ValueError(
+                    f"fetch({offset}, {limit}) returned {len(raw)} rows; the row count may have changed"
+                )
+            with stats.stage("convert"):
+                page = [self.init_row(r) for r in raw]
+            stats.count("rows", len(page))
+            stats.count("prefetched" if prefetched else "cache_misses")
+            with self._lock:
+                hits, self._unreported_hits = self._unreported_hits, 0
+            stats.count("cache_hits", hits)
+
+        with self._lock:
+            if generation != self._generation:
+                return page
+            self._pending.pop(number, None)
+            self._pages[number] = page
+            self._pages.move_to_end(number)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        return page
+
+    def _prefetch(self, number, direction):
+        for step in range(1, self.prefetch + 1):
+            n = number + direction * step
+            if n < 0 or n * self.page_size >= self.row_count:
+                break
+            with self._lock:
+                if n in self._pages or n in self._pending:
+                    continue
+                # the worker waits on the lock so the future is registered first
+                self._pending[n] = self.executor.submit(self._fetch_page, n)
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+            self._pending.clear()
+            self._last_page = None
+            self._generation += 1
+
+
+class PagedClientTable(ClientTable):
+    """
+    Read-only ClientTable over a result set too large to hold locally.  The
+    total `row_count` is known up front and rows are requested a page at a
+    time by calling `fetch(offset, limit)` which returns rows in the form of
+    the ClientTable `rows` argument.  Pages are decoded with the same
+    converter as ClientTable and cached in a PagedRows window.
+
+    >>> def fetch(offset, limit):
+    ...     return [{"id": i} for i in range(offset, offset + limit)]
+    >>> t = PagedClientTable([("id", None)], 25, fetch, page_size=10, max_pages=2)
+    >>> len(t.rows), t.rows[3].id, t.rows[4].id, t.rows[-1].id
+    (25, 3, 4, 24)
+    >>> t.rows.misses, t.rows.hits
+    (2, 1)
+    >>> t.rows[12].id, t.rows[5].id
+    (12, 5)
+    >>> list(t.rows._pages)
+    [1, 0]
+    >>> t.set_value(0, "id", 7)
+    Traceback (most recent call last):
+    ...
+    TypeError: PagedClientTable rows are read-only
+    >>> t.as_tab2()
+    Traceback (most recent call last):
+    ...
+    TypeError: PagedClientTable does not read every row; fetch the rows explicitly
+    """
+
+    def __init__(
+        self,
+        columns,
+        row_count,
+        fetch,
+        page_size=1000,
+        max_pages=16,
+        prefetch=1,
+        executor=None,
+        mixin=None,
+        to_localtime=True,
+        projection=None,
+    ):
+        # set up columns and DataRow as ClientTable does, but without reporting
+        # the empty load; each page fetch is reported instead
+        self.to_localtime = to_localtime
+        self._init_versioning()
+        self.load_stats = None
+        self._load(columns, [], mixin, projection)
+        self._rows = PagedRows(
+            row_count,
+            fetch,
+            self._init_row,
+            page_size=page_size,
+            max_pages=max_pages,
+            prefetch=prefetch,
+            executor=executor,
+        )
+
+    @property
+    def rows(self):
+        return self._rows
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} rows are read-only")
+
+    def _not_paged(self, *args, **kwargs):
+        raise TypeError(
+            f"{self.__class__.__name__} does not read every row; fetch the rows explicitly"
+        )
+
+    publish = _read_only
+    batch = _read_only
+    adding_row = _read_only
+    paste_block = _read_only
+    set_value = _read_only
+    insert_rows = _read_only
+    remove_rows = _read_only
+    # these would quietly fetch every page
+    duplicate = _not_paged
+    as_writable = _not_paged
+    as_http_post_file = _not_paged
+    as_tab2 = _not_paged
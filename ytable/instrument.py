@@ -0,0 +1,167 @@
+"""
+Opt-in timing and counting of the stages of loading a table.  When enabled,
+each ClientTable gets a `load_stats` attribute with per-stage timings (in
+seconds) and counters, and the stats are handed to the sink of the global
+collector.  When disabled, ClientTable takes its original code path and
+`load_stats` is None.  Caches count "cache_hits" (and "cache_misses") in the
+stats of the load or fetch they serve.
+
+    ytable.instrument.enable(sink=lambda stats: print(stats))
+
+    with ytable.instrument.loading("customers") as stats:
+        with stats.stage("json"):
+            payload = json.loads(content)
+        stats.count("bytes", len(content))
+        table = ytable.ClientTable(*payload)
+"""
+
+import time
+import logging
+import threading
+import contextlib
+
+logger = logging.getLogger(__name__)
+
+
+class LoadStats:
+    def __init__(self, name=None):
+        self.name = name
+        self.timings = {}
+        self.counters = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Time a block as stage `name`.  Stages should not be nested since
+        `total` adds them all up.
+        """
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def total(self):
+        # stages are not nested so their sum is the measured time
+        return sum(self.timings.values())
+
+    def __repr__(self):
+        timings = ", ".join(f"{k}={v:.4f}s" for k, v in self.timings.items())
+        counters = ", ".join(f"{k}={v}" for k, v in self.counters.items())
+        return f"LoadStats({self.name!r}, {timings}; {counters})"
+
+
+class NullStats:
+    """
+    Stand-in for LoadStats when instrumentation is disabled so that callers of
+    `loading` need not check.
+    """
+
+    name = None
+    timings = {}
+    counters = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        yield self
+
+    def count(self, name, n=1):
+        pass
+
+    def total(self):
+        return 0.0
+
+
+null_stats = NullStats()
+
+
+def log_sink(stats):
+    logger.info("%r", stats)
+
+
+class Collector:
+    """
+    Receive finished LoadStats, keep running totals and forward each to the
+    sink.  A sink is any callable taking one LoadStats argument.
+    """
+
+    def __init__(self, sink=None):
+        self.enabled = False
+        self.sink = log_sink if sink == None else sink
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.tables = 0
+            self.timings = {}
+            self.counters = {}
+
+    def record(self, stats):
+        with self.lock:
+            self.tables += 1
+            for k, v in stats.timings.items():
+                self.timings[k] = self.timings.get(k, 0.0) + v
+            for k, v in stats.counters.items():
+                self.counters[k] = self.counters.get(k, 0) + v
+        if self.sink != None:
+            self.sink(stats)
+
+
+COLLECTOR = Collector()
+_active = threading.local()
+
+
+def enable(sink=None):
+    if sink != None:
+        COLLECTOR.sink = sink
+    COLLECTOR.enabled = True
+
+
+def disable():
+    COLLECTOR.enabled = False
+
+
+def active():
+    """
+    Return the LoadStats of the innermost `loading` block on this thread or
+    None.
+    """
+    return getattr(_active, "stats", None)
+
+
+@contextlib.contextmanager
+def loading(name=None):
+    """
+    Collect the stages of one table load, including work done by the caller
+    such as reading and JSON decoding, into a single LoadStats.  Tables
+    constructed in the block record into it instead of their own.
+    """
+    if not COLLECTOR.enabled:
+        yield null_stats
+        return
+
+    outer = active()
+    if outer != None:
+        yield outer
+        return
+
+    stats = LoadStats(name)
+    _active.stats = stats
+    try:
+        yield stats
+    finally:
+        _active.stats = None
+        COLLECTOR.record(stats)
+
+
+def stage(name):
+    """
+    Time a stage against the active LoadStats; a no-op outside of `loading`.
+    """
+    stats = active()
+    return stats.stage(name) if stats != None else contextlib.nullcontext()
@@ -0,0 +1,323 @@
+"""
+Toolkit neutral item model over a ClientTable.  The roles and change
+notifications follow Qt's QAbstractItemModel closely enough to be forwarded
+one to one by a thin Qt (or other toolkit) adapter, but there is no GUI
+dependency here.
+
+Changes made within `bus.transaction()` are delivered when the outermost
+transaction ends, with cell and row changes merged into rectangular ranges and
+adjacent inserts and removes merged into single events.  Edits made with
+TableModel.set_data within `model.transaction()` are also held back and
+applied to the table as one version when it ends.
+"""
+
+import contextlib
+
+DISPLAY_ROLE = "display"
+EDIT_ROLE = "edit"
+
+
+class ModelEvent:
+    """
+    A change to the model.  `kind` is one of "changed", "inserted", "removed"
+    or "reset".  Rows first through last (inclusive) are affected; for
+    "changed" only columns first_column through last_column.
+    """
+
+    def __init__(
+        self, kind, first=None, last=None, first_column=None, last_column=None
+    ):
+        self.kind = kind
+        self.first = first
+        self.last = last
+        self.first_column = first_column
+        self.last_column = last_column
+
+    def __repr__(self):
+        if self.kind == "reset":
+            return "ModelEvent(reset)"
+        if self.kind == "changed":
+            return f"ModelEvent(changed, rows {self.first}-{self.last}, columns {self.first_column}-{self.last_column})"
+        return f"ModelEvent({self.kind}, rows {self.first}-{self.last})"
+
+
+class NotificationBus:
+    """
+    Deliver ModelEvents to subscribers.  When coalescing, runs of changed rows
+    separated by at most `gap` unchanged rows are reported as one range since
+    repainting a few extra rows is cheaper than another notification.
+
+    >>> bus = NotificationBus(gap=2)
+    >>> bus.subscribe(print)
+    >>> with bus.transaction():
+    ...     bus.cells_changed(1, 1, 0, 0)
+    ...     bus.cells_changed(4, 4, 2, 3)
+    ...     bus.cells_changed(10, 12, 1, 1)
+    ModelEvent(changed, rows 1-4, columns 0-3)
+    ModelEvent(changed, rows 10-12, columns 1-1)
+
+    Adjacent inserts and removes merge into one event in the row numbers
+    before the transaction.
+
+    >>> with bus.transaction():
+    ...     bus.rows_inserted(5, 6)
+    ...     bus.rows_inserted(7, 7)
+    ...     bus.rows_inserted(5, 5)
+    ModelEvent(inserted, rows 5-8)
+    >>> with bus.transaction():
+    ...     bus.rows_removed(5, 7)
+    ...     bus.rows_removed(5, 5)
+    ...     bus.rows_removed(3, 4)
+    ModelEvent(removed, rows 3-8)
+
+    A reset supersedes everything else in the transaction.
+
+    >>> with bus.transaction():
+    ...     bus.cells_changed(0, 0, 0, 0)
+    ...     bus.reset()
+    ...     bus.rows_inserted(0, 3)
+    ModelEvent(reset)
+    """
+
+    def __init__(self, gap=16):
+        self.gap = gap
+        self.subscribers = []
+        self._depth = 0
+        self._queue = []
+        # row -> [first column, last column] of cell changes not yet queued
+        self._changed = {}
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self.subscribers.remove(callback)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def _deliver(self, event):
+        for callback in list(self.subscribers):
+            callback(event)
+
+    def _reset_pending(self):
+        return len(self._queue) > 0 and self._queue[-1].kind == "reset"
+
+    def cells_changed(self, first, last, first_column, last_column):
+        if self._depth == 0:
+            self._deliver(ModelEvent("changed", first, last, first_column, last_column))
+            return
+        if self._reset_pending():
+            return
+        for row in range(first, last + 1):
+            bounds = self._changed.get(row, None)
+            if bounds == None:
+                self._changed[row] = [first_column, last_column]
+            else:
+                bounds[0] = min(bounds[0], first_column)
+                bounds[1] = max(bounds[1], last_column)
+
+    def _queue_changes(self):
+        # merge runs of nearby rows into one rectangle each
+        current = None
+        for row in sorted(self._changed):
+            c0, c1 = self._changed[row]
+            if current != None and row - current.last <= self.gap + 1:
+                current.last = row
+                current.first_column = min(current.first_column, c0)
+                current.last_column = max(current.last_column, c1)
+            else:
+                current = ModelEvent("changed", row, row, c0, c1)
+                self._queue.append(current)
+        self._changed = {}
+
+    def _structural(self, event):
+        if self._depth == 0:
+            self._deliver(event)
+            return
+        if self._reset_pending():
+            return
+        # pending cell changes refer to row numbers before this event
+        self._queue_changes()
+        previous = self._queue[-1] if len(self._queue) > 0 else None
+        count = event.last - event.first + 1
+        if previous != None and previous.kind == event.kind:
+            if (
+                event.kind == "inserted"
+                and previous.first <= event.first <= previous.last + 1
+            ):
+                previous.last += count
+                return
+            if event.kind == "removed" and event.first == previous.first:
+                previous.last += count
+                return
+            if event.kind == "removed" and event.last + 1 == previous.first:
+                previous.first = event.first
+                return
+        self._queue.append(event)
+
+    def rows_inserted(self, first, last):
+        self._structural(ModelEvent("inserted", first, last))
+
+    def rows_removed(self, first, last):
+        self._structural(ModelEvent("removed", first, last))
+
+    def reset(self):
+        if self._depth == 0:
+            self._deliver(ModelEvent("reset"))
+            return
+        # a reset supersedes everything queued and anything after it
+        self._changed = {}
+        self._queue = [ModelEvent("reset")]
+
+    def flush(self):
+        self._queue_changes()
+        queue, self._queue = self._queue, []
+        for event in queue:
+            self._deliver(event)
+
+
+class TableModel:
+    """
+    Row and column model of a ClientTable.  Columns are those of
+    `table.columns`; display values come from Column.formatter and edits are
+    converted with Column.coerce_edit.
+
+    Within a transaction, edits are collected and applied with one
+    ClientTable.set_values before the notifications are delivered.
+
+    >>> from .client import simple_table
+    >>> t = simple_table(["a", "b"], {"a": {"editable": True}})
+    >>> t.rows = [t.candidate_row() for i in range(3)]
+    >>> model = TableModel(t)
+    >>> model.bus.subscribe(print)
+    >>> version = t.version
+    >>> with model.transaction():
+    ...     model.set_data(0, 0, "x")
+    ...     model.set_data(2, 0, "y")
+    ...     (model.data(0, 0, EDIT_ROLE), t.snapshot()[0].a)
+    ('x', None)
+    ModelEvent(changed, rows 0-2, columns 0-0)
+    >>> [row.a for row in t.snapshot()], t.version - version
+    (['x', None, 'y'], 1)
+    """
+
+    def __init__(self, table, bus=None):
+        self.table = table
+        self.bus = NotificationBus() if bus == None else bus
+        self._depth = 0
+        # (row, attr) -> value of edits not yet applied to the table
+        self._pending = {}
+
+    @contextlib.contextmanager
+    def transaction(self):
+        with self.bus.transaction():
+            self._depth += 1
+            try:
+                yield self.bus
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._apply_pending()
+
+    def _apply_pending(self):
+        # pending edits refer to row numbers before any structural change
+        pending, self._pending = self._pending, {}
+        if len(pending) > 0:
+            self.table.set_values(
+                (row, attr, value) for (row, attr), value in pending.items()
+            )
+
+    def row_count(self):
+        return len(self.table.snapshot())
+
+    def column_count(self):
+        return len(self.table.columns)
+
+    def header(self, column):
+        return self.table.columns[column].label
+
+    def data(self, row, column, role=DISPLAY_ROLE):
+        c = self.table.columns[column]
+        key = (row, c.attr)
+        if key in self._pending:
+            value = self._pending[key]
+        else:
+            value = getattr(self.table.snapshot()[row], c.attr)
+        if role == DISPLAY_ROLE:
+            return c.formatter(value)
+        elif role == EDIT_ROLE:
+            return value
+        raise ValueError(f"unknown role {role}")
+
+    def set_data(self, row, column, text):
+        """
+        Coerce `text` with the column's coerce_edit and assign it.  Errors
+        from coerce_edit propagate to the caller.
+        """
+        c = self.table.columns[column]
+        if not c.editable:
+            raise ValueError(f"column {c.attr} is not editable")
+        value = c.coerce_edit(text)
+        if self._depth > 0:
+            if not 0 <= row < self.row_count():
+                raise IndexError("row index out of range")
+            self._pending[(row, c.attr)] = value
+        else:
+            self.table.set_value(row, c.attr, value)
+        self.bus.cells_changed(row, row, column, column)
+
+    def paste(self, block, top, left):
+        """
+        Apply a 2D block of strings with ClientTable.paste_block and report it
+        as one changed range.  Returns the per-cell errors.
+        """
+        self._apply_pending()
+        errors = self.table.paste_block(block, top, left)
+        width = max((len(line) for line in block), default=0)
+        if len(block) > 0 and width > 0:
+            self.bus.cells_changed(top, top + len(block) - 1, left, left + width - 1)
+        return errors
+
+    def row_changed(self, row):
+        """
+        Report that attributes of `row` were assigned outside of the model.
+        """
+        self.bus.cells_changed(row, row, 0, self.column_count() - 1)
+
+    def insert_rows(self, rows, position=None):
+        rows = list(rows)
+        if len(rows) == 0:
+            return
+        self._apply_pending()
+        position = self.table.insert_rows(rows, position)
+        self.bus.rows_inserted(position, position + len(rows) - 1)
+
+    def remove_rows(self, first, count):
+        """
+        Remove `count` rows starting at `first`; see ClientTable.remove_rows
+        for how they are recorded for saving.
+        """
+        if count <= 0:
+            return
+        self._apply_pending()
+        removed = self.table.remove_rows(first, count)
+        if len(removed) == 0:
+            return
+        self.bus.rows_removed(first, first + len(removed) - 1)
+
+    def reset(self, rows):
+        """
+        Replace the rows with a fresh load from the server.  Edits pending in
+        the transaction and the deletions recorded in the table are dropped.
+        """
+        self._pending = {}
+        self.table.publish(list(rows), reload=True)
+        self.bus.reset()
@@ -4,12 +4,14 @@ import functools
 import datetime
 import keyword
 import base64
+from . import instrument
 
 IDENTIFIER_RE = re.compile(r"^[^\d\W]\w*\Z", re.UNICODE)
 KEYWORD_SET = set(keyword.kwlist)
 
 # This roughly models a Qt QAbstractItemModel, but it has no Qt dependency.
-# See apputils.models for the rest of that.
+# See ytable.models for a toolkit neutral item model and apputils.models for
+# the Qt side.
 
 
 class Unassigned:
@@ -41,7 +43,16 @@ class SlottedRow:
         return f"{self.__class__.__name__}({', '.join(values)})"
 
 
-def fixedrecord(name, members, mixin=None):
+class RawSlottedRow(SlottedRow):
+    """
+    SlottedRow with a slot for the raw row it was decoded from; the slot is
+    not one of the record members.
+    """
+
+    __slots__ = ("_raw_",)
+
+
+def fixedrecord(name, members, mixin=None, base=SlottedRow):
     """
     This is a namedtuple only better.
     """
@@ -60,7 +71,7 @@ def fixedrecord(name, members, mixin=None):
             )
         )
 
-    Kls1 = type(name, (SlottedRow,), {"__slots__": members})
+    Kls1 = type(name, (base,), {"__slots__": members})
     if mixin == None:
         return Kls1
     elif isinstance(mixin, (list, tuple)):
@@ -222,21 +233,25 @@ def type_included(type_):
 
 def parse_columns(column_list):
     # wish to mutate -- work on a copy
-    column_list = copy.deepcopy(column_list)
+    with instrument.stage("columns.copy"):
+        column_list = copy.deepcopy(column_list)
 
     def column_included(attr, meta):
         if meta == None:
             return True
         return type_included(meta.get("type", None))
 
-    return [api_to_model(*x) for x in column_list if column_included(*x)]
+    with instrument.stage("columns.polish"):
+        return [api_to_model(*x) for x in column_list if column_included(*x)]
 
 
 def parse_columns_full(column_list):
     # TODO:  this is an obnoxious minor variant of parse_columns
     # wish to mutate -- work on a copy
-    column_list = copy.deepcopy(column_list)
-    return [api_to_model(*x) for x in column_list]
+    with instrument.stage("columns.copy"):
+        column_list = copy.deepcopy(column_list)
+    with instrument.stage("columns.polish"):
+        return [api_to_model(*x) for x in column_list]
 
 
 def parse_datetime(v):
@@ -302,7 +317,27 @@ def parse_binary(v):
     raise NotImplementedError(f"Binary data interpretation of {type(v)} is unknown")
 
 
-def as_python(columns, to_localtime=True):
+def project_columns(columns, projection):
+    """
+    Return the (attr, meta) pairs of `columns` whose attr is in `projection`
+    in their original order.  A projection of None keeps every column.
+
+    >>> project_columns([('a', None), ('b', None), ('c', None)], {'c', 'a'})
+    [('a', None), ('c', None)]
+    """
+    if projection == None:
+        return columns
+    unknown = set(projection).difference(x[0] for x in columns)
+    if len(unknown) > 0:
+        raise ValueError(
+            "projection names unknown columns:  {}".format(", ".join(sorted(unknown)))
+        )
+    return [x for x in columns if x[0] in projection]
+
+
+def as_python(columns, to_localtime=True, projection=None):
+    columns = project_columns(columns, projection)
+
     def row_coerce(converters, _data):
         return tuple(func(_data[key]) for key, func in converters)
 
@@ -341,7 +376,9 @@ def as_python(columns, to_localtime=True):
     return functools.partial(row_coerce, converters)
 
 
-def as_client(columns, to_localtime=True):
+def as_client(columns, to_localtime=True, projection=None):
+    columns = project_columns(columns, projection)
+
     def row_coerce(converters, _data):
         return tuple(func(_data[key]) for key, func in converters)
 